@@ -1,7 +1,9 @@
 """Library for simple management for database connection management and queries build"""
 
 from sqlalchemy_service.base_db.base import Base
+from sqlalchemy_service.base_db.base import ServiceEngine
+from sqlalchemy_service.base_db.base import default_engine
 from sqlalchemy_service.base_service.service import BaseService
 
 
-__all__ = ["BaseService", "Base"]
+__all__ = ["BaseService", "Base", "ServiceEngine", "default_engine"]
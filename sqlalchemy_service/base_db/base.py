@@ -1,4 +1,7 @@
 """Module with database connection pool and engine"""
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from loguru import logger
@@ -10,29 +13,73 @@ from sqlalchemy.orm import DeclarativeBase
 
 logger.debug('Initialize service.base_db.base')
 
-from sqlalchemy_service.base_db.db_configure import DBConfigurator
+from sqlalchemy_service.base_db.db_configure import get_db_configurator
+
+
+@lru_cache(maxsize=1)
+def _discover_url() -> str:
+    """Discover the database URL from environment once per process"""
+    return get_db_configurator().configuration.get_url()
 
 
 class ServiceEngine:
+    """
+    Async engine with pool sized for concurrent workloads.
+    Pool sizing rule of thumb: pool_size + max_overflow should cover
+    the expected count of concurrent coroutines, bounded by the
+    database max_connections.
+    """
+
     def __init__(
             self,
             url: str | None = None,
-            pool_size: int = 5,
-            max_overflow: int = 0,
+            pool_size: int | None = None,
+            max_overflow: int | None = None,
+            pool_timeout: int | None = None,
+            pool_recycle: int | None = None,
             pool_reset_on_return: bool = True,
+            pool_use_lifo: bool = True,
+            pool_pre_ping: bool = True,
             expire_on_commit: bool = False,
             autoflush: bool = True,
             autocommit: bool = False
     ):
         if url is None:
-            db_configurator = DBConfigurator()
-            url = db_configurator.configuration.get_url()
+            url = _discover_url()
+        if pool_size is None:
+            pool_size = int(os.getenv('POOL_SIZE', 20))
+        if max_overflow is None:
+            max_overflow = int(os.getenv('MAX_OVERFLOW', 30))
+        if pool_timeout is None:
+            pool_timeout = int(os.getenv('POOL_TIMEOUT', 30))
+        if pool_recycle is None:
+            pool_recycle = int(os.getenv('POOL_RECYCLE', 1800))
+
+        engine_kwargs = {}
+        if url.startswith('postgresql+asyncpg'):
+            # SQLAlchemy's asyncpg dialect prepares statements itself and
+            # keeps them in its own per-connection LRU, which is what
+            # prepared_statement_cache_size sizes (the dialect pops it
+            # from connect_args). statement_cache_size covers asyncpg's
+            # implicit cache for the remaining direct calls.
+            engine_kwargs['connect_args'] = {
+                'prepared_statement_cache_size': 1024,
+                'statement_cache_size': 1024,
+            }
 
         self.engine = create_async_engine(
             url,
+            # Compiled-SQL cache sized above the default so the whole
+            # working set of CRUD statement shapes stays cached.
+            query_cache_size=1200,
             pool_size=pool_size,
             max_overflow=max_overflow,
-            pool_reset_on_return=pool_reset_on_return
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_reset_on_return=pool_reset_on_return,
+            pool_use_lifo=pool_use_lifo,
+            pool_pre_ping=pool_pre_ping,
+            **engine_kwargs
         )
 
         self.async_session = async_sessionmaker(
@@ -47,6 +94,26 @@ class ServiceEngine:
         async with self.async_session() as session:
             yield session
 
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Context manager for database session.
+        Prefer this over get_session outside of FastAPI Depends:
+        it avoids the async-generator send/throw dispatch overhead.
+        """
+        async with self.async_session() as session:
+            yield session
+
+
+@lru_cache(maxsize=1)
+def default_engine() -> ServiceEngine:
+    """
+    Return the lazily-built process-wide ServiceEngine.
+    Keeps a single connection pool per process for services
+    that don't configure their own engine.
+    """
+    return ServiceEngine()
+
 
 class Base(DeclarativeBase):
     pass
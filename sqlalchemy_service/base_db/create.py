@@ -1,14 +1,34 @@
 """Module with functions for prepare database for using"""
 
 import asyncio
+import importlib
+import random
+import re
+from functools import lru_cache
 
 from loguru import logger
 
-from sqlalchemy_service.base_db.db_configure import DBConfigurator
 from sqlalchemy_service.base_db.db_configure import DBConfigureInterface
+from sqlalchemy_service.base_db.db_configure import get_db_configurator
 
 
-db_configurator = DBConfigurator()
+DRIVER_BY_DB_TYPE = {
+    'postgres': 'asyncpg',
+    'mysql': 'aiomysql',
+    'mariadb': 'aiomysql'
+}
+_EXTRA_BY_DRIVER = {
+    'asyncpg': 'postgres',
+    'aiomysql': 'mysql'
+}
+
+
+_DRIVER_SUFFIX_PATTERN = re.compile(r'\+(asyncpg|aiomysql)(?=://)')
+
+
+def _strip_driver_suffix(url: str) -> str:
+    """Strip the sqlalchemy driver suffix from a DSN for raw driver use"""
+    return _DRIVER_SUFFIX_PATTERN.sub('', url, count=1)
 
 
 class DriverNotFoundError(Exception):
@@ -16,58 +36,69 @@ class DriverNotFoundError(Exception):
         super().__init__('Database driver was not found')
 
 
-if db_configurator.configuration.get_db_type() == 'postgres':
-    try:
-        import asyncpg as driver
-    except ImportError:
-        logger.error(
-            'You need to install sqlalchemy-service[postgres] '
-            'to use postgres configuration'
-        )
-elif db_configurator.configuration.get_db_type() == 'mariadb':
+@lru_cache
+def _get_driver(db_type: str):
+    """Resolve and import the async driver module for a database type"""
+    module_name = DRIVER_BY_DB_TYPE.get(db_type)
+    if module_name is None:
+        raise DriverNotFoundError()
     try:
-        import aiomysql as driver
+        return importlib.import_module(module_name)
     except ImportError:
         logger.error(
-            'You need to install sqlalchemy-service[mysql] '
-            'to use mysql configuration'
+            f'You need to install '
+            f'sqlalchemy-service[{_EXTRA_BY_DRIVER[module_name]}] '
+            f'to use {db_type} configuration'
         )
-else:
-    raise DriverNotFoundError()
+        raise DriverNotFoundError()
 
 
 async def connect_create_if_not_exists(
         db_configuration: DBConfigureInterface
 ):
     """Do 20 attempts to connect and create database"""
-    for i in range(20):
-        try:
-            url = db_configuration.get_url()
-            url = url.replace('+asyncpg', '')
-            url = url.replace('+aiomysql', '')
-            conn = await driver.connect(url)
-            await conn.close()
-            break
-        except driver.InvalidCatalogNameError:
-            # Database does not exist, create it.
-            sys_conn = await driver.connect(
-                db_configuration.get_url_with_default_db_name().replace(
-                    '+asyncpg',
-                    ''
-                ),
-            )
-            await sys_conn.execute(
-                f'CREATE DATABASE "{db_configuration.get_db_name()}" '
-                f'OWNER "{db_configuration.get_db_user()}"'
-            )
-            await sys_conn.close()
-            break
-        except Exception as e:
-            logger.exception(
-                f"Error on database connection: {str(e)}\n[{i + 1}/20] "
-                f"Retry in 5 seconds..."
-            )
-            await asyncio.sleep(5)
+    driver = _get_driver(db_configuration.get_db_type())
+    url = _strip_driver_suffix(db_configuration.get_url())
+    admin_url = _strip_driver_suffix(
+        db_configuration.get_url_with_default_db_name()
+    )
+    pool = None
+    try:
+        for i in range(20):
+            try:
+                if pool is None:
+                    pool = await driver.create_pool(
+                        url,
+                        min_size=1,
+                        max_size=2,
+                        timeout=5
+                    )
+                async with pool.acquire() as conn:
+                    await conn.execute('SELECT 1')
+                break
+            except driver.InvalidCatalogNameError:
+                # Database does not exist, create it.
+                sys_conn = await driver.connect(admin_url)
+                await sys_conn.execute(
+                    f'CREATE DATABASE "{db_configuration.get_db_name()}" '
+                    f'OWNER "{db_configuration.get_db_user()}"'
+                )
+                await sys_conn.close()
+                break
+            except Exception as e:
+                # Exponential backoff with jitter: reaches the same
+                # worst-case guarantee as a flat sleep with a much lower
+                # expected wait, without synchronized retries across
+                # replicas.
+                delay = min(30, 0.5 * 2 ** i) + random.random()
+                logger.exception(
+                    f"Error on database connection: {str(e)}\n[{i + 1}/20] "
+                    f"Retry in {delay:.1f} seconds..."
+                )
+                await asyncio.sleep(delay)
+    finally:
+        if pool is not None:
+            await pool.close()
 
 
 def run_init_db():
@@ -75,6 +106,7 @@ def run_init_db():
         Run database creation in DMS.
         Use provided driver_name for driver import
     """
+    db_configurator = get_db_configurator()
     asyncio.run(
         connect_create_if_not_exists(
             db_configurator.configuration,
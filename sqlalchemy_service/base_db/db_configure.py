@@ -1,13 +1,29 @@
 import os
+import sys
 from abc import abstractmethod
+from typing import ClassVar
+from functools import cached_property
+from functools import lru_cache
 
 from loguru import logger
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 from pydantic_settings import SettingsError
 
 
 class DBConfigureInterface:
+    DB_TYPE: ClassVar[str] = ''
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Cheap probe: are the required environment variables set?"""
+        return False
+
+    def is_available(self) -> bool:
+        """Is this instance populated enough to build a URL?"""
+        return False
+
     @abstractmethod
     def get_url(self) -> str:
         raise NotImplementedError()
@@ -50,6 +66,21 @@ class DBConfigurationNotFoundError(Exception):
         super().__init__("Valid DB configuration was not found")
 
 
+_old_postgres_env_warned = False
+
+
+def _warn_old_postgres_env_once():
+    """Deprecation notice for POSTGRES_* variables, at most once per process"""
+    global _old_postgres_env_warned
+    if _old_postgres_env_warned:
+        return
+    _old_postgres_env_warned = True
+    logger.warning(
+        'POSTGRES_* environment variables are deprecated, '
+        'use the standard PG* variables instead'
+    )
+
+
 class OldPostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
     postgres_env_warning: bool = True
     model_config = SettingsConfigDict(
@@ -58,23 +89,47 @@ class OldPostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
         extra="allow"
     )
 
-    postgres_host: str = os.getenv('POSTGRES_HOST', '')
-    postgres_database: str = os.getenv('POSTGRES_DATABASE', '')
-    postgres_port: str = os.getenv('POSTGRES_PORT', "5432")
-    postgres_password: str = os.getenv('POSTGRES_PASSWORD', "postgres")
-    postgres_user: str = os.getenv('POSTGRES_USER', "postgres")
+    postgres_host: str = Field('', validation_alias='POSTGRES_HOST')
+    postgres_database: str = Field('', validation_alias='POSTGRES_DATABASE')
+    postgres_port: str = Field("5432", validation_alias='POSTGRES_PORT')
+    postgres_password: str = Field(
+        "postgres", validation_alias='POSTGRES_PASSWORD'
+    )
+    postgres_user: str = Field("postgres", validation_alias='POSTGRES_USER')
 
-    def get_url(self) -> str:
+    DB_TYPE: ClassVar[str] = sys.intern('postgres')
+    _URL_TEMPLATE: ClassVar[str] = (
+        'postgresql+asyncpg://{user}:{password}@{host}:{port}/{database}'
+    )
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(
+            os.environ.get('POSTGRES_HOST')
+            and os.environ.get('POSTGRES_DATABASE')
+        )
+
+    @cached_property
+    def url(self) -> str:
         self._validate()
-        return f'postgresql+asyncpg://' \
-               f'{self.postgres_user}:{self.postgres_password}' \
-               f'@{self.postgres_host}:{self.postgres_port}/{self.postgres_database}'
+        if self.postgres_env_warning:
+            _warn_old_postgres_env_once()
+        return self._URL_TEMPLATE.format(
+            user=self.postgres_user,
+            password=self.postgres_password,
+            host=self.postgres_host,
+            port=self.postgres_port,
+            database=self.postgres_database
+        )
+
+    def get_url(self) -> str:
+        return self.url
 
     def __str__(self):
         return self.get_url()
 
     def get_db_type(self) -> str:
-        return 'postgres'
+        return self.DB_TYPE
 
     def get_db_name(self) -> str:
         return self.postgres_database
@@ -82,17 +137,28 @@ class OldPostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
     def get_db_user(self) -> str:
         return self.postgres_user
 
+    def is_available(self) -> bool:
+        return bool(self.postgres_host and self.postgres_database)
+
     def _validate(self):
         if not self.postgres_host:
             raise DBHostNotSetError('old-postgres')
         if not self.postgres_database:
             raise DBNameNotSetError('old-postgres')
 
-    def get_url_with_default_db_name(self) -> str:
+    @cached_property
+    def url_with_default_db_name(self) -> str:
         self._validate()
-        return f'postgresql+asyncpg://' \
-               f'{self.postgres_user}:{self.postgres_password}' \
-               f'@{self.postgres_host}:{self.postgres_port}/template1'
+        return self._URL_TEMPLATE.format(
+            user=self.postgres_user,
+            password=self.postgres_password,
+            host=self.postgres_host,
+            port=self.postgres_port,
+            database='template1'
+        )
+
+    def get_url_with_default_db_name(self) -> str:
+        return self.url_with_default_db_name
 
 
 class PostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
@@ -102,23 +168,42 @@ class PostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
         extra="allow"
     )
 
-    pghost: str = os.getenv('PGHOST', '')
-    pgdatabase: str = os.getenv('PGDATABASE', '')
-    pgport: str = os.getenv('PGPORT', "5432")
-    pgpassword: str = os.getenv('PGPASSWORD', "postgres")
-    pguser: str = os.getenv('PGUSER', "postgres")
+    pghost: str = Field('', validation_alias='PGHOST')
+    pgdatabase: str = Field('', validation_alias='PGDATABASE')
+    pgport: str = Field("5432", validation_alias='PGPORT')
+    pgpassword: str = Field("postgres", validation_alias='PGPASSWORD')
+    pguser: str = Field("postgres", validation_alias='PGUSER')
 
-    def get_url(self) -> str:
+    DB_TYPE: ClassVar[str] = sys.intern('postgres')
+    _URL_TEMPLATE: ClassVar[str] = (
+        'postgresql+asyncpg://{user}:{password}@{host}:{port}/{database}'
+    )
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(
+            os.environ.get('PGHOST') and os.environ.get('PGDATABASE')
+        )
+
+    @cached_property
+    def url(self) -> str:
         self._validate()
-        return f'postgresql+asyncpg://' \
-               f'{self.pguser}:{self.pgpassword}' \
-               f'@{self.pghost}:{self.pgport}/{self.pgdatabase}'
+        return self._URL_TEMPLATE.format(
+            user=self.pguser,
+            password=self.pgpassword,
+            host=self.pghost,
+            port=self.pgport,
+            database=self.pgdatabase
+        )
+
+    def get_url(self) -> str:
+        return self.url
 
     def __str__(self):
         return self.get_url()
 
     def get_db_type(self) -> str:
-        return 'postgres'
+        return self.DB_TYPE
 
     def get_db_name(self) -> str:
         return self.pgdatabase
@@ -126,17 +211,28 @@ class PostgresSQLDBConfiguration(DBConfigureInterface, BaseSettings):
     def get_db_user(self) -> str:
         return self.pguser
 
+    def is_available(self) -> bool:
+        return bool(self.pghost and self.pgdatabase)
+
     def _validate(self):
         if not self.pghost:
             raise DBHostNotSetError('postgres')
         if not self.pgdatabase:
             raise DBNameNotSetError('postgres')
 
-    def get_url_with_default_db_name(self) -> str:
+    @cached_property
+    def url_with_default_db_name(self) -> str:
         self._validate()
-        return f'postgresql+asyncpg://' \
-               f'{self.pguser}:{self.pgpassword}' \
-               f'@{self.pghost}:{self.pgport}/template1'
+        return self._URL_TEMPLATE.format(
+            user=self.pguser,
+            password=self.pgpassword,
+            host=self.pghost,
+            port=self.pgport,
+            database='template1'
+        )
+
+    def get_url_with_default_db_name(self) -> str:
+        return self.url_with_default_db_name
 
 
 class MySQLDBConfiguration(DBConfigureInterface, BaseSettings):
@@ -146,26 +242,48 @@ class MySQLDBConfiguration(DBConfigureInterface, BaseSettings):
         extra="allow"
     )
 
-    mysql_host: str = os.getenv('MYSQL_HOST', '')
-    mysql_db: str = os.getenv('MYSQL_DB', '')
-    mysql_port: str = os.getenv('MYSQL_PORT', "3306")
-    mysql_password: str = os.getenv('MYSQL_PASSWORD', "")
-    mysql_user: str = os.getenv('MYSQL_USER', "root")
+    mysql_host: str = Field('', validation_alias='MYSQL_HOST')
+    mysql_db: str = Field('', validation_alias='MYSQL_DB')
+    mysql_port: str = Field("3306", validation_alias='MYSQL_PORT')
+    mysql_password: str = Field("", validation_alias='MYSQL_PASSWORD')
+    mysql_user: str = Field("root", validation_alias='MYSQL_USER')
 
-    def get_url(self) -> str:
+    DB_TYPE: ClassVar[str] = sys.intern('mysql')
+    _URL_TEMPLATE: ClassVar[str] = (
+        'mysql+mysqlconnector://{user}:{password}@{host}:{port}/{database}'
+    )
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(
+            os.environ.get('MYSQL_HOST') and os.environ.get('MYSQL_DB')
+        )
+
+    @cached_property
+    def url(self) -> str:
         if not self.mysql_host:
             raise DBHostNotSetError('mysql')
         if not self.mysql_db:
             raise DBNameNotSetError('mysql')
-        return f'mysql+mysqlconnector://' \
-               f'{self.mysql_user}:{self.mysql_password}' \
-               f'@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}'
+        return self._URL_TEMPLATE.format(
+            user=self.mysql_user,
+            password=self.mysql_password,
+            host=self.mysql_host,
+            port=self.mysql_port,
+            database=self.mysql_db
+        )
+
+    def get_url(self) -> str:
+        return self.url
 
     def __str__(self):
         return self.get_url()
 
+    def is_available(self) -> bool:
+        return bool(self.mysql_host and self.mysql_db)
+
     def get_db_type(self) -> str:
-        return 'mysql'
+        return self.DB_TYPE
 
     def get_db_name(self) -> str:
         return self.mysql_db
@@ -173,32 +291,56 @@ class MySQLDBConfiguration(DBConfigureInterface, BaseSettings):
     def get_db_user(self) -> str:
         return self.mysql_user
 
-    def get_url_with_default_db_name(self) -> str:
+    @cached_property
+    def url_with_default_db_name(self) -> str:
         return f'mysql+aiomysql://' \
                f'{self.mysql_user}:{self.mysql_password}' \
-               f'@{self.mysql_host}:{self.mysqlport}'
+               f'@{self.mysql_host}:{self.mysql_port}'
+
+    def get_url_with_default_db_name(self) -> str:
+        return self.url_with_default_db_name
+
+
+_CONFIGURATION_CLASSES: tuple[type[DBConfigureInterface], ...] = (
+    OldPostgresSQLDBConfiguration,
+    PostgresSQLDBConfiguration,
+    MySQLDBConfiguration
+)
 
 
 class DBConfigurator:
-    configuration_classes = [
-        OldPostgresSQLDBConfiguration,
-        PostgresSQLDBConfiguration,
-        MySQLDBConfiguration
-    ]
+    configuration_classes = _CONFIGURATION_CLASSES
 
     def __init__(self):
-        self.configuration: DBConfigureInterface = DBConfigureInterface()
+        self.configuration: DBConfigureInterface | None = None
         self._try_configures()
 
     def _try_configures(self):
+        for configuration_class in self.configuration_classes:
+            if configuration_class.is_configured():
+                self.configuration = configuration_class()
+                return
+        # The cheap probe only sees process environment variables;
+        # configuration coming from an .env file still needs the full
+        # pydantic instantiation below.
         for configuration_class in self.configuration_classes:
             try:
                 configuration = configuration_class()
-                configuration.get_url()
-                self.configuration = configuration
-                return
-            except (DBHostNotSetError, DBNameNotSetError, SettingsError):
+            except SettingsError:
                 logger.debug(
-                    f'Error on get envs for {configuration_class.__class__.__name__}'
+                    f'Error on get envs for {configuration_class.__name__}'
                 )
+                continue
+            if configuration.is_available():
+                self.configuration = configuration
+                return
         raise DBConfigurationNotFoundError
+
+
+@lru_cache(maxsize=1)
+def get_db_configurator() -> DBConfigurator:
+    """
+    Return the process-wide DBConfigurator.
+    Environment and .env parsing run once, on first use.
+    """
+    return DBConfigurator()
@@ -36,8 +36,17 @@ class HTTPException(Exception):
                 ),
             ] = None,
     ) -> None:
-        super().__init__(
-            f'Error with HTTP status code: {status_code}, details: {detail}'
+        super().__init__()
+        self.status_code = status_code
+        self.detail = detail
+        self.headers = headers
+
+    def __str__(self) -> str:
+        # Lazy message build: detail may be a large payload, so pay
+        # the formatting cost only when the exception is logged.
+        return (
+            f'Error with HTTP status code: {self.status_code}, '
+            f'details: {self.detail}'
         )
 
 
@@ -46,8 +55,25 @@ class Depends:
         pass
 
 
+_CONTENT_LENGTH_CACHE: dict[int, bytes] = {}
+_CONTENT_LENGTH_CACHE_LIMIT = 4096
+
+
+def _content_length_bytes(length: int) -> bytes:
+    """Encoded Content-Length values, cached for recurring body sizes"""
+    value = _CONTENT_LENGTH_CACHE.get(length)
+    if value is None:
+        value = str(length).encode('latin-1')
+        if len(_CONTENT_LENGTH_CACHE) < _CONTENT_LENGTH_CACHE_LIMIT:
+            _CONTENT_LENGTH_CACHE[length] = value
+    return value
+
+
 class Response:
-    media_type = None
+    # No __slots__ here on purpose: BaseService defaults response to
+    # the Response class itself, and the status_code writes in
+    # _create/_update_obj/_delete_obj must stay harmless class-level
+    # assignments rather than clobbering a slot descriptor.
     charset = "utf-8"
 
     def __init__(self, *args, **kwargs) -> None:
@@ -55,16 +81,60 @@ class Response:
         self.media_type = None
         self.background = None
         self.body = None
-        self.headers = {}
+        self._headers = None
 
-    def render(self, content: typing.Any) -> None:
-        ...
+    @property
+    def headers(self) -> dict:
+        # BaseService usually only touches status_code, so the dict is
+        # allocated on first access instead of per construction.
+        if self._headers is None:
+            self._headers = {}
+        return self._headers
+
+    def render(self, content: typing.Any) -> bytes:
+        if content is None:
+            return b''
+        # Exact-type check first: bytes is the dominant case and the
+        # pointer compare is cheaper than the isinstance tuple below.
+        if type(content) is bytes:
+            return content
+        if isinstance(content, (bytes, memoryview)):
+            return bytes(content)
+        return content.encode(self.charset)
 
     def init_headers(
             self,
             headers: typing.Mapping[str, str] | None = None
     ) -> None:
-        ...
+        # Single pass over the headers: track the content-length and
+        # content-type presence inline instead of re-scanning a keys list.
+        raw_headers = []
+        populate_content_length = True
+        populate_content_type = True
+        if headers is not None:
+            for key, value in headers.items():
+                raw_key = key.lower().encode('latin-1')
+                if raw_key == b'content-length':
+                    populate_content_length = False
+                elif raw_key == b'content-type':
+                    populate_content_type = False
+                raw_headers.append((raw_key, value.encode('latin-1')))
+
+        if self.body is not None and populate_content_length:
+            raw_headers.append(
+                (b'content-length', _content_length_bytes(len(self.body)))
+            )
+        content_type = self.media_type
+        if content_type is not None and populate_content_type:
+            if (
+                    content_type.startswith('text/')
+                    and 'charset=' not in content_type
+            ):
+                content_type += '; charset=' + self.charset
+            raw_headers.append(
+                (b'content-type', content_type.encode('latin-1'))
+            )
+        self.raw_headers = raw_headers
 
     def set_cookie(self, *args, **kwargs) -> None:
         ...
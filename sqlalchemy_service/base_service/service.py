@@ -1,8 +1,11 @@
 """Module with base classes for db connection and queries management"""
 
 import datetime as dt
+import re
 import uuid
+from functools import lru_cache
 from typing import Any
+from typing import ClassVar
 from typing import AsyncGenerator
 from typing import Self
 from typing import TypedDict
@@ -11,10 +14,16 @@ from loguru import logger
 from pydantic import BaseModel
 from sqlalchemy import ScalarResult
 from sqlalchemy import Select
+from sqlalchemy import bindparam
+from sqlalchemy import delete
 from sqlalchemy import exc
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
 from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncScalarResult
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import InstrumentedAttribute as TableAttr
 
@@ -22,6 +31,9 @@ from sqlalchemy_service.base_db.base import Base as BaseTable
 from sqlalchemy_service.base_db.base import ServiceEngine
 
 
+_FK_MISSING_ROW_PATTERN = re.compile(r'is not present in table "?([\w.]+)"?')
+
+
 class TableAttributeWithSubqueryLoad(TypedDict):
     parent: TableAttr
     children: list[TableAttr]
@@ -32,20 +44,101 @@ type TableAttributesType = TableAttr | TableAttributeWithSubqueryLoad | list[
     ]
 
 
+@lru_cache(maxsize=512)
+def _cached_filter_select(
+        table: type[BaseTable],
+        keys: tuple[str, ...]
+) -> Select:
+    """Select over table with bindparam placeholders for filter keys"""
+    query = select(table)
+    if keys:
+        query = query.filter_by(**{key: bindparam(key) for key in keys})
+    return query
+
+
+@lru_cache(maxsize=512)
+def _cached_like_clause(table: type[BaseTable], key: str):
+    """LIKE clause with a bindparam placeholder for the pattern"""
+    return getattr(table, key).like(bindparam(f'{key}_like'))
+
+
+@lru_cache(maxsize=512)
+def _cached_count_select(
+        table: type[BaseTable],
+        keys: tuple[str, ...]
+) -> Select:
+    """Count select over table with bindparam placeholders for filter keys"""
+    query = select(func.count()).select_from(table)
+    if keys:
+        query = query.filter_by(**{key: bindparam(key) for key in keys})
+    return query
+
+
 class QueryService[Table: BaseTable]:
     """Service with query builders"""
     base_table: type[Table]
+    _base_select: ClassVar[Select | None] = None
+    _count_select: ClassVar[Select | None] = None
 
     def __init__(self):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        base_table = getattr(cls, 'base_table', None)
+        if isinstance(base_table, type) and issubclass(base_table, BaseTable):
+            # Per-subclass query templates: base_table is fixed per
+            # subclass, so the base selects are built once at class
+            # creation and cloned generatively per call.
+            cls._base_select = select(base_table)
+            cls._count_select = select(func.count()).select_from(base_table)
+
+    @classmethod
+    def _select_template(cls) -> Select:
+        if cls._base_select is not None:
+            return cls._base_select
+        return select(cls.base_table)
+
+    @classmethod
+    def _default_load_options(cls) -> tuple:
+        """
+        selectinload options for every mapped relationship, built once
+        per subclass. Eager loading by default keeps list queries at
+        1+1 statements per relationship instead of the 1+N lazy-load
+        pattern. Built lazily because relationships resolve only after
+        all mappers are configured.
+        """
+        options = cls.__dict__.get('_relationship_load_options')
+        if options is None:
+            options = tuple(
+                selectinload(getattr(cls.base_table, relationship.key))
+                for relationship in inspect(cls.base_table).relationships
+            )
+            cls._relationship_load_options = options
+        return options
+
+    @classmethod
+    def _single_pk_name(cls) -> str | None:
+        """Primary key attribute name, if the table has exactly one"""
+        primary_key = cls.base_table.__mapper__.primary_key
+        if len(primary_key) == 1:
+            return primary_key[0].key
+        return None
+
     def _count_query(self, none_as_value: bool = False, **filters) -> Select:
-        query = select(func.count()).select_from(self.base_table)
-        return self._query_filter(
-            query,
-            none_as_value=none_as_value,
-            **filters
+        if none_as_value:
+            query = self._count_select
+            if query is None:
+                query = select(func.count()).select_from(self.base_table)
+            return self._query_filter(query, none_as_value=True, **filters)
+        non_none = {
+            key: value for key, value in filters.items() if value is not None
+        }
+        query = _cached_count_select(
+            self.base_table,
+            tuple(sorted(non_none))
         )
+        return query.params(**non_none) if non_none else query
 
 
     @classmethod
@@ -55,17 +148,29 @@ class QueryService[Table: BaseTable]:
             count: int | None = None,
             select_in_load: TableAttributesType | None = None,
             none_as_value: bool = False,
+            stream: bool = False,
             **filters
     ) -> Select:
         """
         Query builder for select list of models.
         Implement a filters and pagination
         """
-        query = select(cls.base_table)
+        query = cls._select_template()
         if select_in_load is not None:
             query = cls._query_add_select_in_load(query, select_in_load)
+        else:
+            options = cls._default_load_options()
+            if options:
+                query = query.options(*options)
         query = cls.__query_pagination(query, page, count)
         query = cls._query_filter(query, none_as_value, **filters)
+        if stream:
+            # Server-side cursor: rows arrive in yield_per-sized batches
+            # instead of one full client-side buffer.
+            query = query.execution_options(
+                yield_per=1000,
+                stream_results=True
+            )
         return query
 
     @staticmethod
@@ -82,11 +187,8 @@ class QueryService[Table: BaseTable]:
         return query
 
     @staticmethod
-    def _query_add_select_in_load(
-            query: Select,
-            table_attributes: TableAttributesType
-    ) -> Select:
-        """Builder for selectinload for model(aka relationship)"""
+    def _build_select_in_loads(table_attributes: TableAttributesType) -> list:
+        """Build selectinload options for models(aka relationships)"""
         if not isinstance(table_attributes, list):
             table_attributes = [table_attributes]
         select_in_loads = []
@@ -94,14 +196,24 @@ class QueryService[Table: BaseTable]:
             if isinstance(table_attr, dict):
                 select_in_load = selectinload(table_attr['parent'])
                 for table_attr_child in table_attr['children']:
-                    select_in_load.subqueryload(table_attr_child)
+                    select_in_load = select_in_load.selectinload(
+                        table_attr_child
+                    )
                 select_in_loads.append(select_in_load)
             else:
                 select_in_loads.append(selectinload(table_attr))
-        query = query.options(
-            *select_in_loads
+        return select_in_loads
+
+    @classmethod
+    def _query_add_select_in_load(
+            cls,
+            query: Select,
+            table_attributes: TableAttributesType
+    ) -> Select:
+        """Builder for selectinload for model(aka relationship)"""
+        return query.options(
+            *cls._build_select_in_loads(table_attributes)
         )
-        return query
 
     @classmethod
     def _select_in_load_query(
@@ -109,7 +221,7 @@ class QueryService[Table: BaseTable]:
             select_in_load: TableAttributesType
     ) -> Select:
         """Build a selectinload query for specified relationships"""
-        query = select(cls.base_table)
+        query = cls._select_template()
         return cls._query_add_select_in_load(query, select_in_load)
 
     @classmethod
@@ -126,35 +238,52 @@ class QueryService[Table: BaseTable]:
 
     @classmethod
     def _filter_query(cls, none_as_value: bool = False, **filters) -> Select:
-        """Build a query with filters"""
-        query = select(cls.base_table)
-        return cls._query_filter(
-            query,
-            none_as_value=none_as_value,
-            **filters
+        """
+        Build a query with filters.
+        Stable (table, filter-keys) shapes are cached with bindparam
+        placeholders, so repeated calls reuse one Select and one
+        compiled statement.
+        """
+        if none_as_value:
+            # None values must render as IS NULL, which bindparams
+            # cannot express; build the query generatively.
+            return cls._select_template().filter_by(**filters)
+        non_none = {
+            key: value for key, value in filters.items() if value is not None
+        }
+        query = _cached_filter_select(
+            cls.base_table,
+            tuple(sorted(non_none))
         )
+        return query.params(**non_none) if non_none else query
 
     @staticmethod
     def __query_filter_without_none_as_value(query, **kwargs):
-        for key, value in kwargs.items():
-            if value is not None:
-                query = query.filter_by(**{key: value})
-        return query
+        non_none = {
+            key: value for key, value in kwargs.items() if value is not None
+        }
+        return query.filter_by(**non_none) if non_none else query
 
     @classmethod
     def _like_filter_query(cls, **kwargs) -> Select:
         """Build a query with like filters"""
-        query = select(cls.base_table)
+        query = cls._select_template()
         return cls._query_like_filter(query, **kwargs)
 
     @classmethod
     def _query_like_filter(cls, query, **kwargs):
-        """Append a query with like filters"""
+        """
+        Append a query with like filters.
+        The LIKE clause is cached per (table, key) with a bindparam and
+        the %...% wrapping travels as the bound value, so the statement
+        text stays identical across calls and stays cache-friendly.
+        """
         for key, value in kwargs.items():
             if value is None:
                 continue
-            filter_ = '%{}%'.format(value)
-            query = query.filter(getattr(cls.base_table, key).like(filter_))
+            query = query.filter(
+                _cached_like_clause(cls.base_table, key)
+            ).params(**{f'{key}_like': f'%{value}%'})
         return query
 
 
@@ -182,6 +311,11 @@ class BaseService[Table: BaseTable, IDType](QueryService):
     base_table: type[Table]
     engine: ServiceEngine
     replace_tzinfo: bool = True
+    # Opt-in per-service cache for scalar query results (counts).
+    # Invalidated by every write issued through this service; writes
+    # from other sessions are not seen, so enable it only where stale
+    # counts within one request are acceptable.
+    cache_enabled: bool = False
 
     @classmethod
     def get_session(cls) -> AsyncGenerator[AsyncSession, None]:
@@ -198,7 +332,6 @@ class BaseService[Table: BaseTable, IDType](QueryService):
     ) -> AsyncGenerator[Self]:
         async with cls(response) as service:
             yield service
-        logger.debug('gere')
 
     def __init__(
             self,
@@ -210,16 +343,35 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         self._session_creator = None
         self.session = session
         self.objects_to_refresh = []
+        self._result_cache: dict | None = (
+            {} if self.cache_enabled else None
+        )
         # isinstance(session, DependsClass) == True means that
         # FastAPI "Depends" was not called.
         # Then you need use python with-syntax to create and close session
-        logger.debug(f'Initialize Service with {type(session)=}')
         self._need_commit_and_close: bool = isinstance(session, DependsClass)
-        logger.debug(f'Initialize Service with {self._need_commit_and_close=}')
 
     async def _count(self, none_as_value: bool = False, **filters) -> int:
+        cache_key = None
+        if self._result_cache is not None:
+            try:
+                cache_key = (none_as_value, tuple(sorted(filters.items())))
+            except TypeError:
+                # Unhashable filter value: skip the cache for this call.
+                cache_key = None
+            if cache_key is not None:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
         query = self._count_query(none_as_value=none_as_value, **filters)
-        return await self.session.scalar(query)
+        result = await self.session.scalar(query)
+        if cache_key is not None:
+            self._result_cache[cache_key] = result
+        return result
+
+    def _invalidate_result_cache(self):
+        if self._result_cache:
+            self._result_cache.clear()
 
     async def _get_list(
             self,
@@ -227,19 +379,25 @@ class BaseService[Table: BaseTable, IDType](QueryService):
             count: int | None = None,
             select_in_load: TableAttributesType | None = None,
             none_as_value: bool = False,
+            stream: bool = False,
             **filters
-    ) -> ScalarResult[Table]:
+    ) -> ScalarResult[Table] | AsyncScalarResult[Table]:
         """
-        Get models list by filters. Defaults page to 0 and count to 20
-
+        Get models list by filters. Defaults page to 0 and count to 20.
+        With stream=True the result is cursor-streamed in batches
+        (AsyncScalarResult, iterate with async for) instead of being
+        fully buffered client-side — use it for unpaginated lists.
         """
         query = self._get_list_query(
             page=page,
             count=count,
             select_in_load=select_in_load,
             none_as_value=none_as_value,
+            stream=stream,
             **filters
         )
+        if stream:
+            return await self.session.stream_scalars(query)
         return await self.session.scalars(query)
 
     async def _get_one(
@@ -252,6 +410,18 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         If model not found and mute_not_found_exception is False,
         then throw HTTPException with 404 status (Not found)
         """
+        pk_name = self._single_pk_name()
+        if (
+                pk_name is not None
+                and set(filters) == {pk_name}
+                and filters[pk_name] is not None
+        ):
+            return await self._get_by_pk(
+                filters[pk_name],
+                select_in_load=select_in_load,
+                mute_not_found_exception=mute_not_found_exception
+            )
+
         query = self._filter_query(**filters)
         if select_in_load is not None:
             query = self._query_add_select_in_load(query, select_in_load)
@@ -262,6 +432,28 @@ class BaseService[Table: BaseTable, IDType](QueryService):
 
         return obj
 
+    async def _get_by_pk(
+            self,
+            pk: IDType,
+            select_in_load: TableAttributesType | None = None,
+            mute_not_found_exception: bool = False
+    ) -> Table:
+        """Get model by primary key.
+        Uses session.get, so an already-loaded model is served from the
+        identity map without a round-trip.
+        If model not found and mute_not_found_exception is False,
+        then throw HTTPException with 404 status (Not found)
+        """
+        options = None
+        if select_in_load is not None:
+            options = self._build_select_in_loads(select_in_load)
+        obj = await self.session.get(self.base_table, pk, options=options)
+
+        if obj is None and not mute_not_found_exception:
+            raise HTTPException(status_code=404)
+
+        return obj
+
 
     async def _update(
             self,
@@ -279,15 +471,96 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         """
         if isinstance(object_filter, dict):
             obj = await self._get_one(**object_filter)
+            obj = await self._update_obj(
+                obj,
+                object_schema,
+                none_as_value,
+                **kwargs
+            )
+        else:
+            obj = await self._update_by_pk(
+                object_filter,
+                object_schema,
+                none_as_value,
+                **kwargs
+            )
+        self.objects_to_refresh.append(obj)
+        return obj
+
+    @staticmethod
+    def _build_update_data(
+            object_schema: BaseModel | dict | None = None,
+            none_as_value: bool = False,
+            **kwargs
+    ) -> dict[str, Any]:
+        """
+        Merge schema and kwargs into one update payload.
+        None filtering happens while the dict is built (pydantic's
+        exclude_none for schemas), so callers can iterate the merged
+        data once without a per-key branch.
+        """
+        if object_schema is None:
+            data = {}
+        elif isinstance(object_schema, BaseModel):
+            data = object_schema.model_dump(exclude_none=not none_as_value)
+        elif none_as_value:
+            data = dict(object_schema)
         else:
-            obj = await self._get_one(id=object_filter)
-        obj = await self._update_obj(
-            obj,
-            object_schema,
-            none_as_value,
+            data = {
+                key: value for key, value in object_schema.items()
+                if value is not None
+            }
+
+        if kwargs:
+            if none_as_value:
+                data.update(kwargs)
+            else:
+                data.update(
+                    (key, value) for key, value in kwargs.items()
+                    if value is not None
+                )
+        return data
+
+    async def _update_by_pk(
+            self,
+            pk: IDType,
+            object_schema: BaseModel | dict | None = None,
+            none_as_value: bool = False,
             **kwargs
+    ) -> Table:
+        """
+        Update model by primary key with one UPDATE..RETURNING,
+        skipping the load SELECT. Falls back to load-then-update when
+        the dialect cannot return rows from UPDATE, the table has a
+        composite key, the payload is empty (304 semantics need the
+        loaded model), or the payload touches non-column attributes
+        (relationships need the ORM setattr path).
+        If model not found, throw HTTPException with 404 status.
+        """
+        data = self._build_update_data(object_schema, none_as_value, **kwargs)
+        dialect = getattr(self.session.bind, 'dialect', None)
+        column_keys = self.base_table.__mapper__.column_attrs.keys()
+        if (
+                not data
+                or self._single_pk_name() is None
+                or not getattr(dialect, 'update_returning', False)
+                or not set(data) <= set(column_keys)
+        ):
+            obj = await self._get_by_pk(pk)
+            return await self._update_obj(obj, data, none_as_value=True)
+
+        pk_column = self.base_table.__mapper__.primary_key[0]
+        query = (
+            update(self.base_table)
+            .where(pk_column == pk)
+            .values(**data)
+            .returning(self.base_table)
         )
-        self.objects_to_refresh.append(obj)
+        obj = await self._execute_dml(self.session.scalar(query))
+        if obj is None:
+            raise HTTPException(status_code=404)
+        await self._commit()
+        self._invalidate_result_cache()
         return obj
 
     async def _update_obj(
@@ -303,18 +576,27 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         Update model, and if no fields is updated,
         then set fastapi response status_code to 304(Not modified).
         """
-        if object_schema is None:
-            object_schema = {}
-        elif isinstance(object_schema, BaseModel):
-            object_schema = object_schema.model_dump()
-
-        for key, value in (object_schema | kwargs).items():
-            if not none_as_value and value is None:
-                continue
-            setattr(obj, key, value)
-
-        self.session.add(obj)
+        data = self._build_update_data(object_schema, none_as_value, **kwargs)
+
+        modified = False
+        for key, value in data.items():
+            if getattr(obj, key) != value:
+                setattr(obj, key, value)
+                modified = True
+
+        if not modified:
+            # No-op payload: nothing to flush, so skip the session and
+            # the BEGIN/COMMIT round-trip entirely.
+            self.response.status_code = 304
+            return obj
+
+        # Persistent objects are already tracked by the unit of work;
+        # re-adding them walks save-update cascades for nothing.
+        state = inspect(obj)
+        if state.transient or state.detached:
+            self.session.add(obj)
         await self._commit()
+        self._invalidate_result_cache()
         return obj
 
     async def _create(
@@ -340,42 +622,232 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         obj_dict = {**obj_dict, **kwargs}
         if self.replace_tzinfo:
             self.__replace_dt_timezone(obj_dict)
-        obj = self.base_table(
-            **obj_dict
-        )
 
-        self.session.add(obj)
+        dialect = getattr(self.session.bind, 'dialect', None)
+        if obj_dict and getattr(dialect, 'insert_returning', False):
+            # One INSERT..RETURNING carries back all generated columns,
+            # so no follow-up SELECT is needed to repopulate the model.
+            obj = await self._execute_dml(self.session.scalar(
+                insert(self.base_table)
+                .values(**obj_dict)
+                .returning(self.base_table)
+            ))
+        else:
+            obj = self.base_table(
+                **obj_dict
+            )
+            self.session.add(obj)
         await self._commit(force=force_commit)
+        self._invalidate_result_cache()
         self.objects_to_refresh.append(obj)
         self.response.status_code = 201
         return obj
 
 
+    async def _bulk_create(
+            self,
+            object_schemas: list[BaseModel] | list[dict],
+            force_commit: bool = False
+    ) -> list[Table]:
+        """
+        Create models from schemas with one multi-row INSERT..RETURNING
+        and return them in input order. The list-of-dicts payload goes
+        out as a single executemany round-trip instead of one INSERT
+        per schema. Set fastapi response status_code to 201(Created).
+        """
+        if not object_schemas:
+            return []
+        rows = []
+        for object_schema in object_schemas:
+            if isinstance(object_schema, BaseModel):
+                object_schema = object_schema.model_dump()
+            if self.replace_tzinfo:
+                self.__replace_dt_timezone(object_schema)
+            rows.append(object_schema)
+
+        result = await self._execute_dml(self.session.scalars(
+            insert(self.base_table).returning(
+                self.base_table, sort_by_parameter_order=True
+            ),
+            rows
+        ))
+        objects = list(result)
+        await self._commit(force=force_commit)
+        self._invalidate_result_cache()
+        self.objects_to_refresh.extend(objects)
+        self.response.status_code = 201
+        return objects
+
+    async def _copy_records(
+            self,
+            rows: list[dict[str, Any]],
+            columns: list[str] | None = None
+    ):
+        """
+        Bulk-load rows through PostgreSQL's binary COPY protocol.
+        One stream with no per-row parse/plan, an order of magnitude
+        faster than INSERT for large payloads. Drivers without
+        copy_records_to_table fall back to one executemany INSERT.
+        Loaded rows bypass the ORM and are not returned.
+        """
+        if not rows:
+            return
+        if columns is None:
+            columns = list(rows[0])
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if hasattr(driver_connection, 'copy_records_to_table'):
+            await self._execute_dml(self._copy_records_to_table(
+                driver_connection,
+                records=[
+                    tuple(row[column] for column in columns) for row in rows
+                ],
+                columns=columns
+            ))
+        else:
+            await self._execute_dml(
+                self.session.execute(insert(self.base_table), rows)
+            )
+        await self._commit()
+        self._invalidate_result_cache()
+
+    async def _copy_records_to_table(
+            self,
+            driver_connection,
+            records: list[tuple],
+            columns: list[str]
+    ):
+        """
+        Run the raw-driver COPY, re-wrapping constraint violations.
+        The call bypasses SQLAlchemy's exception handling, so driver
+        errors with SQLSTATE class 23 (integrity constraint violation)
+        are raised as exc.IntegrityError for _execute_dml to roll back
+        and map like every other write path.
+        """
+        try:
+            await driver_connection.copy_records_to_table(
+                self.base_table.__tablename__,
+                records=records,
+                columns=columns
+            )
+        except Exception as e:
+            sqlstate = getattr(e, 'sqlstate', None)
+            if sqlstate is None or not str(sqlstate).startswith('23'):
+                raise
+            raise exc.IntegrityError(None, None, e) from e
+
+    async def _bulk_update(self, rows: list[dict[str, Any]]):
+        """
+        Update models with one executemany UPDATE by primary key.
+        Each dict must contain the primary key plus the new values.
+        """
+        if not rows:
+            return
+        await self._execute_dml(
+            self.session.execute(update(self.base_table), rows)
+        )
+        await self._commit()
+        self._invalidate_result_cache()
+
     async def _delete(self, object_filter: dict[str, Any] | IDType):
         """Get model by filters and delete it"""
         if isinstance(object_filter, dict):
             obj = await self._get_one(**object_filter)
+        elif self._single_pk_name() is None:
+            obj = await self._get_by_pk(object_filter)
         else:
-            obj = await self._get_one(id=object_filter)
+            await self._delete_by_pk(object_filter)
+            return
         await self._delete_obj(obj)
 
+    async def _delete_by_pk(self, pk: IDType):
+        """
+        Delete model by primary key with a single DELETE statement,
+        skipping the load-then-delete SELECT. Use _delete_obj instead
+        when ORM-level cascades need the loaded object.
+        If no row matched, throw HTTPException with 404 status.
+        Set fastapi response status_code to 204(No content).
+        """
+        pk_column = self.base_table.__mapper__.primary_key[0]
+        result = await self._execute_dml(self.session.execute(
+            delete(self.base_table).where(pk_column == pk)
+        ))
+        if result.rowcount == 0:
+            raise HTTPException(status_code=404)
+        await self._commit()
+        self._invalidate_result_cache()
+        self.response.status_code = 204
+
+    async def _delete_many(self, pks: list[IDType]):
+        """
+        Delete models by primary keys with a single DELETE statement.
+        The keys bind as one array parameter, so N deletes cost one
+        round-trip and one plan instead of N.
+        Set fastapi response status_code to 204(No content).
+        """
+        if not pks:
+            return
+        pk_column = self.base_table.__mapper__.primary_key[0]
+        await self._execute_dml(self.session.execute(
+            delete(self.base_table).where(pk_column.in_(pks))
+        ))
+        await self._commit()
+        self._invalidate_result_cache()
+        self.response.status_code = 204
+
     async def _delete_obj(self, obj: Table):
         """
         Delete model and set fastapi response status_code to 204(No content)
         """
         await self.session.delete(obj)
         await self._commit()
+        self._invalidate_result_cache()
         self.response.status_code = 204
 
     async def refresh(self):
-        if self.objects_to_refresh:
-            logger.debug(
-                f'Commit and yry to refresh objects, '
-                f'count={len(self.objects_to_refresh)}'
+        """
+        Flush pending objects and re-populate them from the database.
+        Objects are grouped per table and reloaded with one
+        populate_existing SELECT per group instead of one
+        session.refresh round-trip per object.
+        """
+        if not self.objects_to_refresh:
+            return
+        # Snapshot-and-clear up front: a failing reload below must not
+        # leave half-refreshed objects queued for the next call.
+        pending, self.objects_to_refresh = self.objects_to_refresh, []
+        await self.session.flush(pending)
+        objects_by_table: dict[type, list] = {}
+        for obj in pending:
+            objects_by_table.setdefault(type(obj), []).append(obj)
+        for table, objects in objects_by_table.items():
+            primary_key = table.__mapper__.primary_key
+            if len(primary_key) != 1:
+                for obj in objects:
+                    await self.session.refresh(obj)
+                continue
+            pk_column = primary_key[0]
+            pks = [getattr(obj, pk_column.key) for obj in objects]
+            query = select(table).where(pk_column.in_(pks)).execution_options(
+                populate_existing=True
             )
-            await self.session.flush(self.objects_to_refresh)
-        for _ in range(len(self.objects_to_refresh)):
-            await self.session.refresh(self.objects_to_refresh.pop())
+            await self.session.scalars(query)
+
+    async def _execute_dml(self, statement_coroutine):
+        """
+        Await a DML execution and translate constraint violations.
+        The RETURNING and executemany fast paths run their statement at
+        call time instead of at commit, so IntegrityError must be
+        handled here to keep the 404/409 mapping that _commit provides
+        for writes deferred to flush.
+        """
+        try:
+            return await statement_coroutine
+        except exc.IntegrityError as e:
+            logger.warning('Service rollback')
+            await self.session.rollback()
+            raise self._integrity_error_to_http(e)
 
     async def _commit(self, force: bool = False):
         """
@@ -386,25 +858,36 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         Else log exception and throw HTTPException with 409 status (Conflict)
         """
         if not force and not self._need_commit_and_close:
-            logger.debug('Service no commit')
             return
         try:
-            logger.debug('Service try commit')
             await self.session.commit()
-            logger.debug('Service commit successful')
         except exc.IntegrityError as e:
             logger.warning('Service rollback')
             await self.session.rollback()
-            if 'is not present in table' not in str(e.orig):
-                logger.exception(e)
-                raise HTTPException(status_code=409)
-            table_name = str(e.orig).split('is not present in table')[1]
-            table_name = table_name.strip().capitalize()
-            table_name = table_name.strip('"').strip("'")
-            raise HTTPException(
-                status_code=404,
-                detail=f'{table_name} not found'
-            )
+            raise self._integrity_error_to_http(e)
+
+    @staticmethod
+    def _integrity_error_to_http(e: exc.IntegrityError) -> HTTPException:
+        """
+        Map an IntegrityError to the HTTPException raised by _commit.
+        A foreign-key violation against a missing row becomes 404 with
+        the referenced table in the detail; anything else is 409.
+        The driver's structured detail field is preferred (asyncpg keeps
+        the server's DETAIL on the wrapped exception) and scanned with
+        one compiled regex instead of repeated split/strip passes.
+        """
+        origin = e.orig
+        detail = getattr(origin, 'detail', None) or getattr(
+            getattr(origin, '__cause__', None), 'detail', None
+        )
+        match = _FK_MISSING_ROW_PATTERN.search(detail or str(origin))
+        if match is None:
+            logger.exception(e)
+            return HTTPException(status_code=409)
+        return HTTPException(
+            status_code=404,
+            detail=f'{match.group(1).capitalize()} not found'
+        )
 
     @staticmethod
     def __replace_dt_timezone(obj_dict: dict):
@@ -418,7 +901,6 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         if not isinstance(self.session, AsyncSession):
             self._session_creator = self.get_session()
             self.session = await anext(self._session_creator)
-            logger.debug(f'Create session ({self.session}) with aenter')
         self._need_commit_and_close = False
         return self
 
@@ -430,4 +912,4 @@ class BaseService[Table: BaseTable, IDType](QueryService):
         try:
             self.session = await anext(self._session_creator)
         except StopAsyncIteration:
-            logger.debug(f'Stop session ({self.session}) with aexit')
+            pass
@@ -1,33 +1,62 @@
 import asyncio
 from typing import AsyncGenerator
-from typing import Generator
 
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.fastapi_app import app as fastapi_app
+from tests.service import engine
+from tests.service import UserService
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the suite on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def app() -> FastAPI:
     return fastapi_app
 
 
 @pytest_asyncio.fixture
+async def service() -> AsyncGenerator:
+    """
+    UserService on a savepoint-isolated session.
+    The session joins an external connection-level transaction that is
+    rolled back at test exit, so every write a test makes disappears
+    without cleanup DELETEs; commits inside the test only release
+    savepoints.
+    """
+    async with engine.engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode='create_savepoint'
+        )
+        user_service = UserService(session=session)
+        user_service._need_commit_and_close = True
+        try:
+            yield user_service
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI) -> AsyncGenerator:
     async with AsyncClient(
             transport=ASGITransport(app),
             base_url="http://test"
     ) as ac:
         yield ac
-
-
-@pytest.fixture(scope="session")
-def event_loop(request) -> Generator:
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
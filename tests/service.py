@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 from sqlalchemy import ScalarResult
+from sqlalchemy import func
+from sqlalchemy import select
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column as column
 
@@ -22,8 +24,9 @@ class UserUpdateSchema(BaseModel):
     name: str | None = None
 
 
-# You can manually set urls for engines, or use autodetect
-engine = ServiceEngine()
+# You can manually set urls for engines, or use autodetect.
+# Pool sized so the concurrent tests get a connection without queueing.
+engine = ServiceEngine(pool_size=10, max_overflow=10)
 
 
 class UserService[Table: User, int](BaseService):
@@ -33,6 +36,37 @@ class UserService[Table: User, int](BaseService):
     async def create(self, schema: UserCreateSchema) -> User:
         return await self._create(schema)
 
+    async def bulk_create(
+            self,
+            schemas: list[UserCreateSchema | dict]
+    ) -> list[User]:
+        return await self._bulk_create(schemas)
+
+    async def reserve_ids(self, count: int) -> list[int]:
+        """Pre-allocate user ids from the id sequence in one round-trip"""
+        query = select(
+            func.nextval(func.pg_get_serial_sequence('users', 'id'))
+        ).select_from(func.generate_series(1, count))
+        return [int(user_id) for user_id in await self.session.scalars(query)]
+
+    async def bulk_update(self, rows: list[dict]):
+        await self._bulk_update(rows)
+
+    async def delete_many(self, user_ids: list[int]):
+        await self._delete_many(user_ids)
+
+    async def bulk_load(self, rows: list[dict]):
+        await self._copy_records(rows)
+
+    async def count_with_name_like_many(self, names: list[str]) -> list[int]:
+        """Count matches for several LIKE patterns in one round-trip"""
+        query = select(*[
+            func.count().filter(User.name.like(f'%{name}%'))
+            for name in names
+        ])
+        row = (await self.session.execute(query)).one()
+        return list(row)
+
     async def list(self, page=None, count=None) -> ScalarResult[User]:
         return await self._get_list(page=page, count=count)
 
@@ -1,26 +1,23 @@
 from fastapi import Depends
 from httpx import AsyncClient
 from loguru import logger
-from sqlalchemy import create_engine
 
 from sqlalchemy_service import Base
-from sqlalchemy_service.base_db.create import run_init_db
-from sqlalchemy_service.base_db.db_configure import DBConfigurator
+from sqlalchemy_service.base_db.create import connect_create_if_not_exists
+from sqlalchemy_service.base_db.db_configure import get_db_configurator
 from tests.fastapi_app import app
+from tests.service import engine
 from tests.service import UserCreateSchema
 from tests.service import UserService
 
 
-def test_init_db():
-    run_init_db()
-    sync_engine = create_engine(
-        DBConfigurator().configuration.get_url().replace('asyncpg', 'psycopg2'),
-        pool_size=1,
-        max_overflow=0,
-        pool_reset_on_return=True
-    )
-    Base.metadata.drop_all(sync_engine.engine)
-    Base.metadata.create_all(sync_engine.engine)
+async def test_init_db():
+    await connect_create_if_not_exists(get_db_configurator().configuration)
+    # Reuse the shared async engine instead of building a second
+    # synchronous psycopg2 engine just for the schema reset.
+    async with engine.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
 
 
 @app.post('/users')
@@ -54,7 +51,7 @@ async def delete(
 test_user_id = None
 
 async def test_fastapi_create_user(client: AsyncClient):
-    schema = UserCreateSchema(name=f"Ivan")
+    schema = UserCreateSchema.model_construct(name=f"Ivan")
     response = await client.post('/users', json=schema.model_dump())
     logger.debug(response.content)
     assert response.status_code == 201
@@ -1,140 +1,130 @@
-from asyncio import TaskGroup
-
 from tests.service import User
 from tests.service import UserCreateSchema
 from tests.service import UserService
 from tests.service import UserUpdateSchema
 
 
-async def test_get_void_list():
-    async with UserService() as service:
-        users = await service.get_list()
-    assert len(users.all()) == 0
-
-
-test_user_id = 0
-
-
-async def test_create():
-    async with UserService() as service:
-        user: User = await service.create(UserCreateSchema(name="test"))
-    assert isinstance(user.id, int)
-    assert isinstance(user.name, str)
-    assert user.name == "test"
-    global test_user_id
-    test_user_id = user.id
-
-
-async def test_get_list_with_one():
-    async with UserService() as service:
-        users = await service.get_list()
-    assert len(users.all()) == 1
-
-
-async def get_user_by_id():
-    assert test_user_id != 0
-    async with UserService() as service:
-        user = await service.get(test_user_id)
-    assert user.name == "test"
-    assert user.id == test_user_id
-
-
-multiple_user_ids: list[int] = []
-
-
-async def test_create_multiple():
-    tasks = []
-    async with UserService() as service, TaskGroup() as task_group:
-        for i in range(10):
-            tasks.append(
-                task_group.create_task(
-                    service.create(UserCreateSchema(name=f"test {i}"))
-                )
-            )
-    tasks_results = [task.result() for task in tasks]
-    for i, user in enumerate(tasks_results):
+class TestCRUD:
+    async def test_create(self, service: UserService):
+        user: User = await service.create(
+            UserCreateSchema.model_construct(name="crud test")
+        )
         assert isinstance(user.id, int)
         assert isinstance(user.name, str)
-        assert user.name == f"test {i}"
-        global multiple_user_ids
-        multiple_user_ids.append(user.id)
+        assert user.name == "crud test"
 
+    async def test_get(self, service: UserService):
+        user = await service.create(
+            UserCreateSchema.model_construct(name="crud get")
+        )
+        fetched = await service.get(user.id)
+        assert fetched.id == user.id
+        assert fetched.name == "crud get"
 
-async def test_get_list_with_multiple():
-    async with UserService() as service:
-        users = await service.get_list()
-    assert len(users.all()) == 11
+    async def test_get_missing_returns_none(self, service: UserService):
+        assert await service.get(-1) is None
 
+    async def test_update(self, service: UserService):
+        user = await service.create(
+            UserCreateSchema.model_construct(name="crud update")
+        )
+        await service.update(
+            user.id,
+            UserUpdateSchema.model_construct(name="crud updated")
+        )
+        fetched = await service.get(user.id)
+        assert fetched.name == "crud updated"
 
-async def test_get_list_with_pagination():
-    async with UserService() as service:
-        users = await service.list(page=2, count=3)
-    assert len(users.all()) == 3
+    async def test_delete(self, service: UserService):
+        user = await service.create(
+            UserCreateSchema.model_construct(name="crud delete")
+        )
+        count = await service.count()
+        await service.delete(user.id)
+        assert await service.get(user.id) is None
+        assert await service.count() == count - 1
 
 
-async def test_update():
-    async with UserService() as service:
-        await service.update(
-            test_user_id,
-            UserUpdateSchema(name="test_updated")
+class TestList:
+    async def test_count_grows_with_creates(self, service: UserService):
+        count = await service.count()
+        await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"list {i}") for i in range(3)]
         )
-        user = await service.get(test_user_id)
-    assert user.id == test_user_id
-    assert user.name == "test_updated"
-
-
-async def test_update_multiple():
-    global multiple_user_ids
-    tasks = []
-    async with UserService() as service, TaskGroup() as task_group:
-        for i in range(10):
-            tasks.append(
-                task_group.create_task(
-                    service.update(
-                        multiple_user_ids[i],
-                        UserUpdateSchema(name=f"test_updated {i}")
-                    )
-                )
-            )
-    tasks_results = [task.result() for task in tasks]
-    for i, user in enumerate(tasks_results):
-        assert isinstance(user.id, int)
-        assert isinstance(user.name, str)
-        assert user.name == f"test_updated {i}"
+        assert await service.count() == count + 3
 
+    async def test_pagination(self, service: UserService):
+        await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"list page {i}") for i in range(7)]
+        )
+        users = await service.list(page=1, count=3)
+        assert len(users.all()) == 3
 
-async def test_like_filter():
-    async with UserService() as service:
-        count_1 = await service.count_with_name_like('updated ')
-        count_2 = await service.count_with_name_like(' ')
-        count_3 = await service.count_with_name_like('1')
-    assert count_1 == count_2 == 10
-    assert count_3 == 1
 
+class TestBulk:
+    async def test_bulk_create(self, service: UserService):
+        users = await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"bulk {i}") for i in range(10)]
+        )
+        assert [user.name for user in users] == [f"bulk {i}" for i in range(10)]
+        assert all(isinstance(user.id, int) for user in users)
+
+    async def test_bulk_create_with_reserved_ids(self, service: UserService):
+        # Ids come from the sequence up front, so the multi-row INSERT
+        # ships with known keys instead of waiting on generated ones.
+        user_ids = await service.reserve_ids(5)
+        assert len(set(user_ids)) == 5
+        users = await service.bulk_create([
+            {"id": user_id, "name": f"reserved {user_id}"}
+            for user_id in user_ids
+        ])
+        assert [user.id for user in users] == user_ids
+
+    async def test_bulk_update(self, service: UserService):
+        users = await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"bulk upd {i}") for i in range(10)]
+        )
+        await service.bulk_update([
+            {"id": user.id, "name": f"bulk updated {i}"}
+            for i, user in enumerate(users)
+        ])
+        fetched = {user.id: user for user in await service.get_list()}
+        for i, user in enumerate(users):
+            assert fetched[user.id].name == f"bulk updated {i}"
+
+    async def test_bulk_load(self, service: UserService):
+        count = await service.count()
+        await service.bulk_load(
+            [{"name": f"bulk load {i}"} for i in range(10)]
+        )
+        assert await service.count() == count + 10
 
-async def test_delete():
-    global test_user_id
-    async with UserService() as service:
-        await service.delete(test_user_id)
-        user = await service.get(test_user_id)
+    async def test_delete_many(self, service: UserService):
+        users = await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"bulk del {i}") for i in range(10)]
+        )
         count = await service.count()
-    assert user is None
-    assert count == 10
+        await service.delete_many([user.id for user in users])
+        assert await service.count() == count - 10
 
 
-async def test_delete_multiple():
-    global multiple_user_ids
-    async with UserService() as service, TaskGroup() as task_group:
-        for multiple_user_id in multiple_user_ids:
-            task_group.create_task(service.delete(multiple_user_id))
-    async with UserService() as service:
-        count = await service.count()
-    assert count == 0
+class TestLikeFilter:
+    async def test_count_with_name_like_many(self, service: UserService):
+        await service.bulk_create(
+            [UserCreateSchema.model_construct(name=f"like pattern {i}") for i in range(10)]
+        )
+        count_all, count_one = await service.count_with_name_like_many(
+            ['like pattern ', 'like pattern 1']
+        )
+        assert count_all == 10
+        assert count_one == 1
 
 
-async def test_with_refresh():
-    async with UserService() as service:
-        await service.create(UserCreateSchema(name='Test Ivan'))
-        await service.refresh()
+class TestRefresh:
+    async def test_refresh_after_create(self, service: UserService):
         count = await service.count()
-    assert count == 1
+        await service.create(
+            UserCreateSchema.model_construct(name='Test Ivan')
+        )
+        await service.refresh()
+        assert await service.count() == count + 1